@@ -0,0 +1,36 @@
+import numpy as np
+
+# date.fromordinal(1) is a Monday, so weekday = (ordinal + 6) % 7
+ORDINAL_WEEKDAY_OFFSET = 6
+
+# Ordinal of 1970-01-01, day 0 of datetime64[D]
+UNIX_EPOCH_ORDINAL = 719163
+
+def weekdays(ordinals: np.ndarray) -> np.ndarray:
+    """Get the weekday (0 = Monday, 6 = Sunday) of date ordinals
+    
+    Args:
+        ordinals: int64 array of date ordinals
+        
+    Returns:
+        np.ndarray: uint8 array of weekdays
+    """
+    return ((ordinals + ORDINAL_WEEKDAY_OFFSET) % 7).astype(np.uint8)
+
+def count_weekends(starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """Count weekend days in each inclusive [start, end] ordinal range
+    
+    Args:
+        starts: int64 array of start date ordinals
+        ends: int64 array of end date ordinals
+        
+    Returns:
+        np.ndarray: int64 array with the number of weekend days per range
+    """
+    def weekends_before(days: np.ndarray) -> np.ndarray:
+        # Weekend days among weekday-aligned days [0, days)
+        return 2 * (days // 7) + np.maximum(days % 7 - 5, 0)
+    
+    first = starts + ORDINAL_WEEKDAY_OFFSET
+    stop = np.maximum(ends + 1, starts) + ORDINAL_WEEKDAY_OFFSET
+    return weekends_before(stop) - weekends_before(first)
@@ -1,7 +1,10 @@
-from typing import List, Optional, Dict, Any
-from datetime import datetime, timedelta
+from typing import List, Optional, Dict, Any, Tuple
+from datetime import datetime
+import threading
+import numpy as np
 from .models import Task, TaskImpact, AnalysisResponse
 from .date_utils import DateUtils
+from ._kernels import UNIX_EPOCH_ORDINAL, count_weekends, weekdays
 import logging
 
 logger = logging.getLogger(__name__)
@@ -12,6 +15,55 @@ class ProjectAnalyzer:
     def __init__(self):
         """Initialize the analyzer with date utilities"""
         self.date_utils = DateUtils()
+        # (tasks, size, result) for the last task list seen. The analyzer is shared by
+        # every session's script thread, so the caches are only touched under the lock.
+        self._lock = threading.Lock()
+        self._interval_cache: Optional[Tuple[List[Task], int, Tuple[np.ndarray, ...]]] = None
+        self._analysis_cache: Optional[Tuple[List[Task], int, Dict[str, AnalysisResponse]]] = None
+    
+    def clear_cache(self):
+        """Drop cached results, called when a new task list is loaded"""
+        with self._lock:
+            self._interval_cache = None
+            self._analysis_cache = None
+    
+    def _task_date_arrays(self, tasks: List[Task]) -> Tuple[np.ndarray, np.ndarray]:
+        """Build start/end date arrays for a list of tasks
+        
+        Args:
+            tasks: List of project tasks
+            
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: datetime64[D] arrays of start and end dates
+        """
+        start_arr = np.array([task.start_date for task in tasks], dtype='datetime64[D]')
+        end_arr = np.array([task.end_date for task in tasks], dtype='datetime64[D]')
+        return start_arr, end_arr
+    
+    def _get_interval_index(self, tasks: List[Task]) -> Tuple[np.ndarray, ...]:
+        """Get start/end dates sorted for binary search, rebuilt when the task list changes
+        
+        Args:
+            tasks: List of project tasks
+            
+        Returns:
+            Tuple[np.ndarray, ...]: start dates, end dates, start order, sorted starts, end order, sorted ends
+        """
+        with self._lock:
+            cache = self._interval_cache
+            if cache is not None and cache[0] is tasks and cache[1] == len(tasks):
+                return cache[2]
+            
+            start_arr, end_arr = self._task_date_arrays(tasks)
+            start_order = np.argsort(start_arr, kind='stable')
+            end_order = np.argsort(end_arr, kind='stable')
+            interval_index = (
+                start_arr, end_arr,
+                start_order, start_arr[start_order],
+                end_order, end_arr[end_order]
+            )
+            self._interval_cache = (tasks, len(tasks), interval_index)
+            return interval_index
     
     def find_holiday_tasks(self, tasks: List[Task]) -> List[TaskImpact]:
         """Find tasks that start or end on holidays
@@ -19,34 +71,52 @@ class ProjectAnalyzer:
         Args:
             tasks: List of project tasks to analyze
             
+        Returns:
+            List[TaskImpact]: List of impacted tasks with impact details
+        """
+        # Shared with the other analyses of the same task list, see analyze_all
+        return self.analyze_all(tasks)["holiday_impact"].impacted_tasks
+    
+    def _holiday_impacts(self, tasks: List[Task], start_mask: np.ndarray, end_mask: np.ndarray) -> List[TaskImpact]:
+        """Build holiday impacts for tasks flagged by start/end holiday masks
+        
+        Args:
+            tasks: List of project tasks
+            start_mask: True where the task starts on a holiday
+            end_mask: True where the task ends on a holiday
+            
         Returns:
             List[TaskImpact]: List of impacted tasks with impact details
         """
         impacted_tasks = []
+        holiday_map = self.date_utils.holiday_map
         
-        for task in tasks:
-            start_holiday = self.date_utils.is_holiday(task.start_date)
-            end_holiday = self.date_utils.is_holiday(task.end_date)
+        for i in np.where(start_mask | end_mask)[0]:
+            task = tasks[i]
+            start_holiday = start_mask[i]
+            end_holiday = end_mask[i]
             
-            if start_holiday or end_holiday:
-                impact_desc = []
-                
-                if start_holiday:
-                    holiday_name = self.date_utils.get_holiday_name(task.start_date)
-                    impact_desc.append(f"Task starts on holiday: {holiday_name} ({task.start_date.strftime('%Y-%m-%d')})")
-                
-                if end_holiday:
-                    holiday_name = self.date_utils.get_holiday_name(task.end_date)
-                    impact_desc.append(f"Task ends on holiday: {holiday_name} ({task.end_date.strftime('%Y-%m-%d')})")
-                
-                impact = TaskImpact(
-                    task=task,
-                    impact_type="holiday",
-                    impact_description="; ".join(impact_desc),
-                    delay_days=1 if start_holiday else 0  # Assuming 1 day delay if start date is holiday
-                )
-                
-                impacted_tasks.append(impact)
+            if start_holiday and end_holiday:
+                start_name = holiday_map.get(task.start_date, '')
+                end_name = holiday_map.get(task.end_date, '')
+                impact_desc = (f"Task starts on holiday: {start_name} ({task.start_date:%Y-%m-%d}); "
+                               f"Task ends on holiday: {end_name} ({task.end_date:%Y-%m-%d})")
+            elif start_holiday:
+                start_name = holiday_map.get(task.start_date, '')
+                impact_desc = f"Task starts on holiday: {start_name} ({task.start_date:%Y-%m-%d})"
+            else:
+                end_name = holiday_map.get(task.end_date, '')
+                impact_desc = f"Task ends on holiday: {end_name} ({task.end_date:%Y-%m-%d})"
+            
+            # Fields are built from validated tasks, skip re-validation
+            impact = TaskImpact.model_construct(
+                task=task,
+                impact_type="holiday",
+                impact_description=impact_desc,
+                delay_days=1 if start_holiday else 0  # Assuming 1 day delay if start date is holiday
+            )
+            
+            impacted_tasks.append(impact)
         
         return impacted_tasks
     
@@ -56,33 +126,51 @@ class ProjectAnalyzer:
         Args:
             tasks: List of project tasks to analyze
             
+        Returns:
+            List[TaskImpact]: List of impacted tasks with impact details
+        """
+        # Shared with the other analyses of the same task list, see analyze_all
+        return self.analyze_all(tasks)["weekend_tasks"].impacted_tasks
+    
+    def _weekend_impacts(self, tasks: List[Task], start_wd: np.ndarray, end_wd: np.ndarray) -> List[TaskImpact]:
+        """Build weekend impacts for tasks from their start/end weekdays
+        
+        Args:
+            tasks: List of project tasks
+            start_wd: Weekday of each task start date, 0 = Monday
+            end_wd: Weekday of each task end date, 0 = Monday
+            
         Returns:
             List[TaskImpact]: List of impacted tasks with impact details
         """
         impacted_tasks = []
         
-        for task in tasks:
-            start_weekend = self.date_utils.is_weekend(task.start_date)
-            end_weekend = self.date_utils.is_weekend(task.end_date)
+        start_mask = start_wd >= 5
+        end_mask = end_wd >= 5
+        # 2 days delay if starting on Saturday, 1 day if Sunday
+        delays = np.where(start_mask, np.where(start_wd == 5, 2, 1), 0).tolist()
+        
+        for i in np.where(start_mask | end_mask)[0]:
+            task = tasks[i]
+            start_weekend = start_mask[i]
+            end_weekend = end_mask[i]
             
-            if start_weekend or end_weekend:
-                impact_desc = []
-                
-                if start_weekend:
-                    impact_desc.append(f"Task starts on weekend ({task.start_date.strftime('%Y-%m-%d')})")
-                
-                if end_weekend:
-                    impact_desc.append(f"Task ends on weekend ({task.end_date.strftime('%Y-%m-%d')})")
-                
-                impact = TaskImpact(
-                    task=task,
-                    impact_type="weekend",
-                    impact_description="; ".join(impact_desc),
-                    delay_days=2 if start_weekend and task.start_date.weekday() == 5 else 1 if start_weekend else 0
-                    # 2 days delay if starting on Saturday, 1 day if Sunday
-                )
-                
-                impacted_tasks.append(impact)
+            if start_weekend and end_weekend:
+                impact_desc = (f"Task starts on weekend ({task.start_date:%Y-%m-%d}); "
+                               f"Task ends on weekend ({task.end_date:%Y-%m-%d})")
+            elif start_weekend:
+                impact_desc = f"Task starts on weekend ({task.start_date:%Y-%m-%d})"
+            else:
+                impact_desc = f"Task ends on weekend ({task.end_date:%Y-%m-%d})"
+            
+            impact = TaskImpact.model_construct(
+                task=task,
+                impact_type="weekend",
+                impact_description=impact_desc,
+                delay_days=delays[i]
+            )
+            
+            impacted_tasks.append(impact)
         
         return impacted_tasks
     
@@ -102,25 +190,35 @@ class ProjectAnalyzer:
         is_holiday = self.date_utils.is_holiday(target_date)
         holiday_name = self.date_utils.get_holiday_name(target_date) if is_holiday else ""
         
-        for task in tasks:
-            # Check if target date falls within task duration
-            if task.start_date <= target_date <= task.end_date:
-                impact_type = "holiday" if is_holiday else "weekend" if self.date_utils.is_weekend(target_date) else "general_query"
-                
-                impact_desc = f"Task is active on {target_date.strftime('%Y-%m-%d')}"
-                if is_holiday:
-                    impact_desc += f" which is a holiday: {holiday_name}"
-                elif self.date_utils.is_weekend(target_date):
-                    impact_desc += " which is a weekend"
-                
-                impact = TaskImpact(
-                    task=task,
-                    impact_type=impact_type,
-                    impact_description=impact_desc,
-                    delay_days=1 if is_holiday or self.date_utils.is_weekend(target_date) else 0
-                )
-                
-                impacted_tasks.append(impact)
+        # Check if target date falls within task duration: binary search both
+        # bounds, then filter the smaller candidate set by the other bound
+        start_arr, end_arr, start_order, starts_sorted, end_order, ends_sorted = self._get_interval_index(tasks)
+        target = np.datetime64(target_date, 'D')
+        started = start_order[:np.searchsorted(starts_sorted, target, side='right')]
+        not_ended = end_order[np.searchsorted(ends_sorted, target, side='left'):]
+        if len(started) <= len(not_ended):
+            active = started[end_arr[started] >= target]
+        else:
+            active = not_ended[start_arr[not_ended] <= target]
+        
+        for i in np.sort(active):
+            task = tasks[i]
+            impact_type = "holiday" if is_holiday else "weekend" if self.date_utils.is_weekend(target_date) else "general_query"
+            
+            impact_desc = f"Task is active on {target_date:%Y-%m-%d}"
+            if is_holiday:
+                impact_desc += f" which is a holiday: {holiday_name}"
+            elif self.date_utils.is_weekend(target_date):
+                impact_desc += " which is a weekend"
+            
+            impact = TaskImpact.model_construct(
+                task=task,
+                impact_type=impact_type,
+                impact_description=impact_desc,
+                delay_days=1 if is_holiday or self.date_utils.is_weekend(target_date) else 0
+            )
+            
+            impacted_tasks.append(impact)
         
         return impacted_tasks
     
@@ -130,24 +228,28 @@ class ProjectAnalyzer:
         Args:
             tasks: List of project tasks to analyze
             
+        Returns:
+            AnalysisResponse: Analysis of weekend impact on project
+        """
+        # Shared with the other analyses of the same task list, see analyze_all
+        return self.analyze_all(tasks)["weekend_impact"]
+    
+    def _weekend_impact_response(self, tasks: List[Task], weekend_counts: np.ndarray) -> AnalysisResponse:
+        """Build the no-weekend-work analysis from per-task weekend day counts
+        
+        Args:
+            tasks: List of project tasks
+            weekend_counts: Number of weekend days spanned by each task
+            
         Returns:
             AnalysisResponse: Analysis of weekend impact on project
         """
         impacted_tasks = []
         total_delay = 0
         
-        for task in tasks:
-            # Count weekends within task duration
-            weekend_days = 0
-            current_date = task.start_date
-            
-            while current_date <= task.end_date:
-                if self.date_utils.is_weekend(current_date):
-                    weekend_days += 1
-                current_date += timedelta(days=1)
-            
+        for task, weekend_days in zip(tasks, weekend_counts.tolist()):
             if weekend_days > 0:
-                impact = TaskImpact(
+                impact = TaskImpact.model_construct(
                     task=task,
                     impact_type="weekend",
                     impact_description=f"Task spans {weekend_days} weekend days",
@@ -166,6 +268,52 @@ class ProjectAnalyzer:
             analysis_summary=f"Project would be delayed by approximately {total_delay} days if no weekend work is allowed."
         )
     
+    def analyze_all(self, tasks: List[Task]) -> Dict[str, AnalysisResponse]:
+        """Run holiday, weekend and no-weekend-work analyses in a single pass
+        
+        Results are cached for the last task list seen and reused until a
+        different list is passed.
+        
+        Args:
+            tasks: List of tasks to analyze
+            
+        Returns:
+            Dict[str, AnalysisResponse]: Analyses keyed by "holiday_impact", "weekend_tasks" and "weekend_impact"
+        """
+        with self._lock:
+            cache = self._analysis_cache
+            if cache is not None and cache[0] is tasks and cache[1] == len(tasks):
+                return cache[2]
+            
+            start_arr, end_arr = self._task_date_arrays(tasks)
+            starts = start_arr.view('int64') + UNIX_EPOCH_ORDINAL
+            ends = end_arr.view('int64') + UNIX_EPOCH_ORDINAL
+            
+            if len(tasks) > 0:
+                holiday_arr = self.date_utils.get_holiday_array(
+                    min(start_arr.min(), end_arr.min()).astype(object),
+                    max(start_arr.max(), end_arr.max()).astype(object)
+                )
+            else:
+                holiday_arr = np.array([], dtype='datetime64[D]')
+            
+            holiday_tasks = self._holiday_impacts(tasks, np.isin(start_arr, holiday_arr), np.isin(end_arr, holiday_arr))
+            weekend_tasks = self._weekend_impacts(tasks, weekdays(starts), weekdays(ends))
+            
+            results = {
+                "holiday_impact": AnalysisResponse(
+                    impacted_tasks=holiday_tasks,
+                    analysis_summary=f"Found {len(holiday_tasks)} tasks impacted by holidays"
+                ),
+                "weekend_tasks": AnalysisResponse(
+                    impacted_tasks=weekend_tasks,
+                    analysis_summary=f"Found {len(weekend_tasks)} tasks impacted by weekends"
+                ),
+                "weekend_impact": self._weekend_impact_response(tasks, count_weekends(starts, ends))
+            }
+            self._analysis_cache = (tasks, len(tasks), results)
+            return results
+    
     def analyze_query(self, query_type: str, tasks: List[Task], specific_date: Optional[datetime] = None) -> AnalysisResponse:
         """Analyze tasks based on query type
         
@@ -177,16 +325,8 @@ class ProjectAnalyzer:
         Returns:
             AnalysisResponse: Analysis results
         """
-        if query_type == "holiday_impact":
-            impacted_tasks = self.find_holiday_tasks(tasks)
-            summary = f"Found {len(impacted_tasks)} tasks impacted by holidays"
-            return AnalysisResponse(
-                impacted_tasks=impacted_tasks,
-                analysis_summary=summary
-            )
-            
-        elif query_type == "weekend_impact":
-            return self.calculate_weekend_impact(tasks)
+        if query_type in ("holiday_impact", "weekend_impact"):
+            return self.analyze_all(tasks)[query_type]
             
         elif query_type == "specific_date" and specific_date:
             impacted_tasks = self.find_tasks_impacted_by_date(tasks, specific_date)
@@ -201,4 +341,7 @@ class ProjectAnalyzer:
             return AnalysisResponse(
                 impacted_tasks=[],
                 analysis_summary="Invalid query type or missing required parameters"
-            )
\ No newline at end of file
+            )
+
+# Shared analyzer so holiday data, bitmaps and caches persist across requests
+analyzer = ProjectAnalyzer()
\ No newline at end of file
@@ -15,6 +15,14 @@ class Settings(BaseSettings):
     MAX_TOKENS: int = 2048
     TEMPERATURE: float = 0.3
     
+    # Ask the LLM to phrase holiday and weekend answers instead of building them from the analysis
+    USE_LLM_FOR_STRUCTURAL_RESPONSES: bool = False
+    
+    # LLM response cache, persisted when diskcache is installed
+    LLM_CACHE_DIR: Optional[str] = "./.llm_cache"
+    LLM_CACHE_SIZE_LIMIT: int = 256 << 20  # 256 MB
+    LLM_CACHE_EXPIRE: Optional[float] = 86400  # 1 day
+    
     class Config:
         env_file = ".env"
 
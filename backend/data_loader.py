@@ -1,19 +1,77 @@
 import pandas as pd
+import numpy as np
+import re
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import BinaryIO, List, Dict, Any, Union
 from .models import Task
 import logging
 
 logger = logging.getLogger(__name__)
 
+try:
+    import python_calamine  # noqa: F401
+    EXCEL_ENGINE = 'calamine'
+except ImportError:
+    EXCEL_ENGINE = None  # Let pandas pick openpyxl/xlrd from the file type
+
+# Columns read from the MS Project export
+REQUIRED_COLUMNS = ['Index', 'Task Name', 'Duration', 'Start', 'Finish', 'Predecessors', 'Successors']
+
+# Text columns are read as strings so dates and durations are the only parsed values
+TEXT_COLUMN_DTYPES = {
+    'Index': str,
+    'Task Name': str,
+    'Duration': str,
+    'Predecessors': str,
+    'Successors': str
+}
+
+# Text before the first duration unit, with the units tried in a fixed order: a value
+# containing 'wk' is read as weeks even if 'day' occurs too, and so on. Values without
+# a unit are read as a bare number of days.
+_DURATION_RE = re.compile(
+    r'^(?:(?=.*wk)(?P<wk>.*?)wk|(?=.*day)(?P<day>.*?)day|(?=.*week)(?P<week>.*?)week'
+    r'|(?=.*hour)(?P<hour>.*?)hour|(?P<number>.*))',
+    re.DOTALL
+)
+
+# Days per unit, keyed by the _DURATION_RE group the number was captured in
+_DURATION_UNIT_DAYS = {
+    'wk': 5,        # 1 week = 5 working days
+    'day': 1,
+    'week': 5,
+    'hour': 1 / 8,  # 8 hours = 1 day
+    'number': 1
+}
+
+def _to_float(text: str) -> float:
+    """float() of a duration number, NaN where it is not a number"""
+    try:
+        return float(text)
+    except ValueError:
+        return np.nan
+
 class DataLoader:
     """Class for loading and processing MS Project data from Excel"""
     
-    def __init__(self, file_path: str):
-        """Initialize with the path to the Excel file"""
+    def __init__(self, file_path: Union[str, BinaryIO]):
+        """Initialize with the path to the Excel file, or a file-like object holding it"""
         self.file_path = file_path
         self.raw_data = None
-        self.tasks = []
+        self._tasks: List[Task] = []
+        self._task_index: Dict[str, Task] = {}
+    
+    @property
+    def tasks(self) -> List[Task]:
+        """Processed tasks"""
+        return self._tasks
+    
+    @tasks.setter
+    def tasks(self, tasks: List[Task]):
+        """Set processed tasks and rebuild the task ID index"""
+        self._tasks = tasks
+        # Build in reverse so the first task wins when IDs are duplicated
+        self._task_index = {task.id: task for task in reversed(tasks)}
     
     def load_data(self) -> bool:
         """Load data from Excel file
@@ -22,49 +80,44 @@ class DataLoader:
             bool: True if data loaded successfully, False otherwise
         """
         try:
-            self.raw_data = pd.read_excel(self.file_path)
+            self.raw_data = pd.read_excel(
+                self.file_path,
+                engine=EXCEL_ENGINE,
+                usecols=lambda col: col in REQUIRED_COLUMNS,  # A callable keeps missing columns reportable below
+                dtype=TEXT_COLUMN_DTYPES
+            )
             logger.info(f"Successfully loaded data from {self.file_path}")
             return True
         except Exception as e:
             logger.error(f"Error loading data: {str(e)}")
             return False
     
-    def _process_duration(self, duration_str):
-        """Process duration string into number of days"""
-        if pd.isna(duration_str) or not duration_str:
-            return 0
+    def _process_durations(self, durations: pd.Series) -> pd.Series:
+        """Process duration strings into number of days
         
-        try:
-            # Handle case where duration is already a number
-            if isinstance(duration_str, (int, float)):
-                return int(duration_str)
-                
-            # Remove any non-numeric characters and extract the number
-            duration_str = str(duration_str).strip().lower()
+        Args:
+            durations: Series of duration values from Excel
             
-            # Handle different duration formats
-            if 'wk' in duration_str:  # Handle both 'wk' and 'wks'
-                # Extract the number before 'wk'
-                weeks = float(duration_str.split('wk')[0].strip())
-                return int(weeks * 5)  # Convert weeks to days
-            elif 'day' in duration_str:
-                # Extract the number before 'days'
-                days = float(duration_str.split('day')[0].strip())
-                return int(days)
-            elif 'week' in duration_str:
-                # Convert weeks to days (1 week = 5 working days)
-                weeks = float(duration_str.split('week')[0].strip())
-                return int(weeks * 5)
-            elif 'hour' in duration_str:
-                # Convert hours to days (8 hours = 1 day)
-                hours = float(duration_str.split('hour')[0].strip())
-                return int(hours / 8)
-            else:
-                # Try to convert directly to integer
-                return int(float(duration_str))
-        except Exception as e:
-            logger.warning(f"Could not parse duration '{duration_str}': {str(e)}. Using 0.")
-            return 0
+        Returns:
+            pd.Series: Duration in days for each row
+        """
+        duration_text = durations.astype(str)
+        
+        # One regex match per cell splits off the number and names its unit
+        match = duration_text.str.strip().str.lower().str.extract(_DURATION_RE)
+        units = match.notna().idxmax(axis=1)
+        number_text = match.bfill(axis=1).iloc[:, 0]
+        
+        # Few distinct values repeat across a project, convert each one once
+        numbers = number_text.map({text: _to_float(text) for text in number_text.unique()})
+        days = numbers * units.map(_DURATION_UNIT_DAYS)
+        valid = np.isfinite(days)
+        
+        invalid = ~valid & durations.notna() & (duration_text != '')
+        for duration_str in durations[invalid]:
+            logger.warning(f"Could not parse duration '{duration_str}'. Using 0.")
+        
+        return np.trunc(days.where(valid, 0)).astype(int)
 
     def process_data(self) -> List[Task]:
         """Process raw data into Task objects"""
@@ -73,53 +126,48 @@ class DataLoader:
             return []
         
         try:
-            tasks = []
-            
             # Drop any completely empty rows
             self.raw_data = self.raw_data.dropna(how='all')
             
             # Ensure required columns exist
-            required_columns = ['Index', 'Task Name', 'Duration', 'Start', 'Finish', 'Predecessors', 'Successors']  
-            missing_columns = [col for col in required_columns if col not in self.raw_data.columns]
+            missing_columns = [col for col in REQUIRED_COLUMNS if col not in self.raw_data.columns]
             if missing_columns:
                 logger.error(f"Missing required columns: {missing_columns}")
                 return []
-                
-            for _, row in self.raw_data.iterrows():
-                # Skip rows where essential data is missing
-                if pd.isna(row['Index']) or pd.isna(row['Task Name']):
-                    continue
-                    
-                # Extract task data from row
-                task_id = str(row['Index'])
-                task_name = str(row['Task Name'])
-                
-                # Handle date parsing with validation
-                start_date = self._parse_date(row['Start'])
-                end_date = self._parse_date(row['Finish'])
-                
-                # Ensure end date is not before start date
-                if end_date < start_date:
-                    end_date = start_date
-                
-                # Get duration in days
-                duration = self._process_duration(row['Duration'])
-                
-                # Extract dependencies
-                predecessors = self._parse_dependencies(row.get('Predecessors', ''))
-                successors = self._parse_dependencies(row.get('Successors', ''))
-                
-                task = Task(
-                    id=task_id,
-                    name=task_name,
+            
+            # Skip rows where essential data is missing
+            df = self.raw_data[self.raw_data['Index'].notna() & self.raw_data['Task Name'].notna()]
+            
+            # Handle date parsing with validation
+            start_dates = self._parse_dates(df['Start'])
+            end_dates = self._parse_dates(df['Finish'])
+            
+            # Ensure end date is not before start date
+            end_dates = end_dates.where(end_dates >= start_dates, start_dates)
+            
+            # Get duration in days
+            durations = self._process_durations(df['Duration'])
+            
+            # Extract dependencies
+            predecessors = self._parse_dependencies(df['Predecessors'])
+            successors = self._parse_dependencies(df['Successors'])
+            
+            # Columns are already cleaned and typed above, skip per-task validation
+            tasks = [
+                Task.model_construct(
+                    id=str(task_id),
+                    name=str(task_name),
                     start_date=start_date,
                     end_date=end_date,
                     duration=duration,
-                    predecessors=predecessors,
-                    successors=successors
+                    predecessors=task_predecessors,
+                    successors=task_successors
                 )
-                
-                tasks.append(task)
+                for task_id, task_name, start_date, end_date, duration, task_predecessors, task_successors in zip(
+                    df['Index'], df['Task Name'], start_dates.dt.date, end_dates.dt.date, durations,
+                    predecessors, successors
+                )
+            ]
             
             self.tasks = tasks
             logger.info(f"Processed {len(tasks)} tasks from data")
@@ -129,45 +177,36 @@ class DataLoader:
             logger.error(f"Error processing data: {str(e)}")
             return []
     
-    def _parse_date(self, date_value) -> datetime:
-        """Parse date from Excel format
+    def _parse_dates(self, date_values: pd.Series) -> pd.Series:
+        """Parse dates from Excel format
         
         Args:
-            date_value: Date value from Excel
+            date_values: Series of date values from Excel
             
         Returns:
-            datetime: Parsed datetime object
+            pd.Series: Parsed datetimes, current date where missing or unparseable
         """
-        if pd.isna(date_value):
-            return datetime.now()  # Default to current date if missing
+        dates = pd.to_datetime(date_values, errors='coerce', format='mixed')
         
-        if isinstance(date_value, datetime):
-            return date_value
-        
-        try:
-            return pd.to_datetime(date_value)
-        except:
+        unparseable = dates.isna() & date_values.notna()
+        for date_value in date_values[unparseable]:
             logger.warning(f"Could not parse date: {date_value}, using current date")
-            return datetime.now()
+        
+        return dates.fillna(pd.Timestamp(datetime.now()))  # Default to current date if missing
     
-    def _parse_dependencies(self, deps_str) -> List[str]:
-        """Parse dependency strings into list of task IDs
+    def _parse_dependencies(self, deps: pd.Series) -> pd.Series:
+        """Parse dependency strings into lists of task IDs
         
         Args:
-            deps_str: String containing dependencies
+            deps: Series of dependency strings from Excel
             
         Returns:
-            List[str]: List of task IDs
+            pd.Series: List of task IDs for each row
         """
-        if pd.isna(deps_str) or not deps_str:
-            return []
-        
         # MS Project typically uses comma-separated IDs for dependencies
         # May need adjustment based on actual format
-        try:
-            return [dep.strip() for dep in str(deps_str).split(',')]
-        except:
-            return []
+        split_deps = deps.fillna('').astype(str).str.split(',', regex=False)
+        return split_deps.apply(lambda ids: [dep.strip() for dep in ids if dep.strip()])
     
     def get_task_by_id(self, task_id: str) -> Task:
         """Get a task by its ID
@@ -178,10 +217,7 @@ class DataLoader:
         Returns:
             Task: Task object if found, None otherwise
         """
-        for task in self.tasks:
-            if task.id == task_id:
-                return task
-        return None
+        return self._task_index.get(task_id)
     
     def get_all_tasks(self) -> List[Task]:
         """Get all tasks
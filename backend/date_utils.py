@@ -1,13 +1,121 @@
 import holidays
-from datetime import datetime, timedelta
-from typing import List, Tuple
+import numpy as np
+from datetime import date, datetime, timedelta
+from typing import List, NamedTuple, Optional, Tuple
+from ._kernels import weekdays
+
+# Bits used in the per-day business-day bitmap
+WEEKEND_BIT = 1
+HOLIDAY_BIT = 2
+
+# Shared US holidays, holidays.US() populates each year the first time it is looked up
+_US_HOLIDAYS = holidays.US()
+
+class _BusinessDayBitmap(NamedTuple):
+    """Per-day weekend/holiday bits and prefix sums, indexed by days since epoch"""
+    epoch: np.datetime64
+    bits: np.ndarray
+    ps_weekend: np.ndarray
+    ps_holiday: np.ndarray
+    ps_non_business: np.ndarray
 
 class DateUtils:
     """Utility class for handling date-related operations"""
     
     def __init__(self):
         """Initialize with US holidays"""
-        self.us_holidays = holidays.US()
+        self.us_holidays = _US_HOLIDAYS
+        self._holiday_years = set()
+        self._holiday_array = np.array([], dtype='datetime64[D]')
+        # Plain {date: name} dict for bulk name lookups, kept in step with _holiday_array
+        self.holiday_map = {}
+        
+        # Replaced as a whole when extended, so concurrent readers never see a partial update
+        self._bitmap: Optional[_BusinessDayBitmap] = None
+    
+    def _day_span(self, start_date: datetime, end_date: datetime) -> Tuple[np.datetime64, int]:
+        """Convert an inclusive date range into a first day and a day count
+        
+        Args:
+            start_date: Start date
+            end_date: End date
+            
+        Returns:
+            Tuple[np.datetime64, int]: First day of the range and number of days in it
+        """
+        num_days = max((end_date - start_date).days + 1, 0)
+        return np.datetime64(start_date, 'D'), num_days
+    
+    def get_holiday_array(self, start_date: datetime, end_date: datetime) -> np.ndarray:
+        """Get holidays as a datetime64 array covering the given date range
+        
+        Args:
+            start_date: Start date
+            end_date: End date
+            
+        Returns:
+            np.ndarray: Sorted array of holiday dates
+        """
+        years = set(range(start_date.year, end_date.year + 1))
+        if not years <= self._holiday_years:
+            # Touching a year makes holidays.US() populate it lazily
+            for year in years - self._holiday_years:
+                self.us_holidays.get(f"{year}-01-01")
+            self._holiday_array = np.array(sorted(self.us_holidays.keys()), dtype='datetime64[D]')
+            self.holiday_map = dict(self.us_holidays)
+            self._holiday_years = self._holiday_years | years
+        return self._holiday_array
+    
+    def _bitmap_index(self, start_date: datetime, end_date: datetime) -> Tuple[_BusinessDayBitmap, int, int]:
+        """Get the bitmap slice for an inclusive date range, extending the bitmap if needed
+        
+        Args:
+            start_date: Start date
+            end_date: End date
+            
+        Returns:
+            Tuple[_BusinessDayBitmap, int, int]: Bitmap, index of the first day in it and number of days in the range
+        """
+        first_day, num_days = self._day_span(start_date, end_date)
+        stop_day = first_day + num_days
+        
+        bitmap = self._bitmap
+        if bitmap is None or first_day < bitmap.epoch or stop_day > bitmap.epoch + len(bitmap.bits):
+            first_year = first_day.astype(object).year
+            last_year = (stop_day - 1).astype(object).year
+            if bitmap is not None:
+                first_year = min(first_year, bitmap.epoch.astype(object).year)
+                last_year = max(last_year, (bitmap.epoch + len(bitmap.bits) - 1).astype(object).year)
+            bitmap = self._build_bitmap(date(first_year, 1, 1), date(last_year, 12, 31))
+            self._bitmap = bitmap
+        
+        return bitmap, int((first_day - bitmap.epoch).astype(int)), num_days
+    
+    def _build_bitmap(self, first_date: date, last_date: date) -> _BusinessDayBitmap:
+        """Build the weekend/holiday bitmap and its prefix sums for a date range
+        
+        Args:
+            first_date: First date covered by the bitmap
+            last_date: Last date covered by the bitmap
+            
+        Returns:
+            _BusinessDayBitmap: Bitmap covering the range
+        """
+        epoch = np.datetime64(first_date, 'D')
+        days = (last_date - first_date).days + 1
+        offsets = np.arange(days)
+        
+        bits = np.zeros(days, dtype=np.uint8)
+        bits[weekdays(offsets + first_date.toordinal()) >= 5] |= WEEKEND_BIT
+        bits[np.isin(epoch + offsets, self.get_holiday_array(first_date, last_date))] |= HOLIDAY_BIT
+        
+        return _BusinessDayBitmap(
+            epoch=epoch,
+            bits=bits,
+            ps_weekend=np.concatenate(([0], np.cumsum((bits & WEEKEND_BIT) != 0))),
+            ps_holiday=np.concatenate(([0], np.cumsum((bits & HOLIDAY_BIT) != 0))),
+            ps_non_business=np.concatenate(([0], np.cumsum(bits != 0)))
+        )
     
     def is_holiday(self, date: datetime) -> bool:
         """Check if a given date is a US federal holiday
@@ -40,10 +148,12 @@ class DateUtils:
         Returns:
             datetime: Next business day
         """
-        next_day = date + timedelta(days=1)
-        while self.is_holiday(next_day) or self.is_weekend(next_day):
-            next_day += timedelta(days=1)
-        return next_day
+        day = np.datetime64(date, 'D')
+        
+        # Runs of weekends and holidays are short, two weeks of holidays is plenty
+        holiday_array = self.get_holiday_array(date, date + timedelta(days=14))
+        next_day = np.busday_offset(day + 1, 0, roll='forward', holidays=holiday_array)
+        return date + timedelta(days=int((next_day - day).astype(int)))
     
     def calculate_business_days(self, start_date: datetime, end_date: datetime) -> int:
         """Calculate number of business days between two dates
@@ -55,15 +165,8 @@ class DateUtils:
         Returns:
             int: Number of business days
         """
-        business_days = 0
-        current_date = start_date
-        
-        while current_date <= end_date:
-            if not (self.is_holiday(current_date) or self.is_weekend(current_date)):
-                business_days += 1
-            current_date += timedelta(days=1)
-            
-        return business_days
+        bitmap, index, num_days = self._bitmap_index(start_date, end_date)
+        return num_days - int(bitmap.ps_non_business[index + num_days] - bitmap.ps_non_business[index])
     
     def get_holiday_name(self, date: datetime) -> str:
         """Get the name of the holiday for a given date
@@ -76,6 +179,32 @@ class DateUtils:
         """
         return self.us_holidays.get(date, '')
     
+    def weekend_count(self, start_date: datetime, end_date: datetime) -> int:
+        """Count weekend days between two dates (inclusive)
+        
+        Args:
+            start_date: Start date
+            end_date: End date
+            
+        Returns:
+            int: Number of weekend days
+        """
+        bitmap, index, num_days = self._bitmap_index(start_date, end_date)
+        return int(bitmap.ps_weekend[index + num_days] - bitmap.ps_weekend[index])
+    
+    def holiday_count(self, start_date: datetime, end_date: datetime) -> int:
+        """Count holidays between two dates (inclusive)
+        
+        Args:
+            start_date: Start date
+            end_date: End date
+            
+        Returns:
+            int: Number of holidays
+        """
+        bitmap, index, num_days = self._bitmap_index(start_date, end_date)
+        return int(bitmap.ps_holiday[index + num_days] - bitmap.ps_holiday[index])
+    
     def find_impacted_dates(self, start_date: datetime, end_date: datetime) -> List[Tuple[datetime, str]]:
         """Find all holidays and weekends between two dates
         
@@ -87,13 +216,14 @@ class DateUtils:
             List[Tuple[datetime, str]]: List of (date, reason) tuples
         """
         impacted_dates = []
-        current_date = start_date
+        bitmap, index, num_days = self._bitmap_index(start_date, end_date)
+        bits = bitmap.bits[index:index + num_days]
         
-        while current_date <= end_date:
-            if self.is_holiday(current_date):
+        for offset in np.where(bits != 0)[0]:
+            current_date = start_date + timedelta(days=int(offset))
+            if bits[offset] & HOLIDAY_BIT:
                 impacted_dates.append((current_date, f"Holiday: {self.get_holiday_name(current_date)}"))
-            elif self.is_weekend(current_date):
+            else:
                 impacted_dates.append((current_date, "Weekend"))
-            current_date += timedelta(days=1)
             
         return impacted_dates
\ No newline at end of file
@@ -1,13 +1,15 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import List, Optional, Literal
-from datetime import datetime
+from datetime import date, datetime
 
 class Task(BaseModel):
     """Model representing a project task"""
+    model_config = ConfigDict(frozen=True)
+    
     id: str
     name: str
-    start_date: datetime
-    end_date: datetime
+    start_date: date
+    end_date: date
     duration: int
     predecessors: Optional[List[str]] = None
     successors: Optional[List[str]] = None
@@ -20,8 +22,10 @@ class TaskAnalysisRequest(BaseModel):
 
 class TaskImpact(BaseModel):
     """Model representing task impact analysis"""
+    model_config = ConfigDict(frozen=True)
+    
     task: Task
-    impact_type: Literal["holiday", "weekend"]
+    impact_type: Literal["holiday", "weekend", "general_query"]
     impact_description: str
     delay_days: Optional[int] = None
 
@@ -1,9 +1,9 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 import sys
 import os
+import io
+import hashlib
 from datetime import datetime, timedelta
 import logging
 
@@ -11,8 +11,7 @@ import logging
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from backend.data_loader import DataLoader
-from backend.analyzer import ProjectAnalyzer
-from llm.query_processor import QueryProcessor
+from backend.analyzer import analyzer
 from backend.config import settings
 
 # Configure logging
@@ -22,32 +21,66 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Maximum number of tasks drawn in the Gantt chart, the data table still lists all of them
+MAX_GANTT_ROWS = 50
+
+# st.cache_data is shared by every session of the server, so each cache keeps
+# only a few recent results and drops them after an hour
+CACHE_MAX_ENTRIES = 16
+CACHE_TTL = 3600
+
+# Heavy objects shared across reruns and sessions.
+# plotly and the LLM client stack are imported where first needed to keep the first page load fast.
+@st.cache_resource
+def get_analyzer():
+    return analyzer
+
+@st.cache_resource
+def get_query_processor():
+    from llm.query_processor import QueryProcessor
+    return QueryProcessor()
+
+# Analyses are memoized on the tasks signature, the tasks list itself is not hashed
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES, ttl=CACHE_TTL)
+def holiday_tasks(tasks_sig, _tasks):
+    return get_analyzer().find_holiday_tasks(_tasks)
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES, ttl=CACHE_TTL)
+def weekend_tasks(tasks_sig, _tasks):
+    return get_analyzer().find_weekend_tasks(_tasks)
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES, ttl=CACHE_TTL)
+def weekend_impact(tasks_sig, _tasks):
+    return get_analyzer().calculate_weekend_impact(_tasks)
+
+def tasks_signature(tasks):
+    return hash(tuple(task.model_dump_json() for task in tasks))
+
 # Initialize session state
 def init_session_state():
-    if 'data_loaded' not in st.session_state:
-        st.session_state.data_loaded = False
-    if 'tasks' not in st.session_state:
-        st.session_state.tasks = []
-    if 'data_loader' not in st.session_state:
-        st.session_state.data_loader = None
-    if 'analyzer' not in st.session_state:
-        st.session_state.analyzer = ProjectAnalyzer()
-    if 'query_processor' not in st.session_state:
-        st.session_state.query_processor = QueryProcessor()
-    if 'chat_history' not in st.session_state:
-        st.session_state.chat_history = []
+    st.session_state.setdefault('data_loaded', False)
+    st.session_state.setdefault('tasks', [])
+    st.session_state.setdefault('tasks_sig', None)
+    st.session_state.setdefault('chat_history', [])
+
+# Parse an uploaded project file, reruns with the same upload reuse the parsed tasks
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES, ttl=CACHE_TTL)
+def parse_project_file(file_bytes):
+    data_loader = DataLoader(io.BytesIO(file_bytes))
+    if not data_loader.load_data():
+        return None
+    return data_loader.process_data()
 
 # Load data function
-def load_data(file_path):
+def load_data(file_bytes):
     try:
-        data_loader = DataLoader(file_path)
-        success = data_loader.load_data()
+        tasks = parse_project_file(file_bytes)
         
-        if success:
-            tasks = data_loader.process_data()
+        if tasks is not None:
             st.session_state.data_loaded = True
             st.session_state.tasks = tasks
-            st.session_state.data_loader = data_loader
+            st.session_state.tasks_sig = tasks_signature(tasks)
+            get_analyzer().clear_cache()
             return True, f"Successfully loaded {len(tasks)} tasks"
         else:
             return False, "Failed to load data"
@@ -55,60 +88,118 @@ def load_data(file_path):
         logger.error(f"Error loading data: {str(e)}")
         return False, f"Error: {str(e)}"
 
+# Rebuild a stored chart, historical messages reuse the same figure object across reruns.
+# Charts go through plotly's default "auto" JSON engine, which is orjson when installed.
+@st.cache_resource(show_spinner=False)
+def chart_from_json(chart_json):
+    import plotly.io as pio
+    return pio.from_json(chart_json)
+
+# Chat history entry for a response, keyed by its content so widget keys stay stable as history grows
+def assistant_message(response):
+    digest = hashlib.md5(response['text'].encode())
+    if response['chart_json'] is not None:
+        digest.update(response['chart_json'].encode())
+    return {"role": "assistant", "content": response, "mkey": digest.hexdigest()[:8]}
+
+# Text shown while a response streams in
+def response_text(llm_response):
+    return getattr(llm_response, 'impact_summary', None) or getattr(llm_response, 'answer', None) or ""
+
+# Stream the LLM's summary text as it arrives, the last (complete) response is kept in holder
+def stream_llm_text(query, holder):
+    shown = ""
+    for llm_response in get_query_processor().stream_query(query, st.session_state.tasks):
+        holder["response"] = llm_response
+        text = response_text(llm_response)
+        if text.startswith(shown) and len(text) > len(shown):
+            yield text[len(shown):]
+            shown = text
+
+# Response shown when a query fails
+def error_response(e):
+    logger.error(f"Error processing query: {str(e)}")
+    return {"text": f"Error processing your query: {str(e)}", "follow_up": [], "data": None, "chart_json": None}
+
 # Process user query
-def process_query(query):
+def process_query(query, llm_response=None):
     try:
-        # Process query using LLM
-        llm_response = st.session_state.query_processor.process_query(query)
-        
-        # Based on response type, perform appropriate analysis
-        if llm_response.response_type == "task_analysis":
-            if llm_response.analysis_type == "holiday_impact":
-                analysis = st.session_state.analyzer.find_holiday_tasks(st.session_state.tasks)
-                return format_task_impact_response(llm_response, analysis)
-            
-            elif llm_response.analysis_type == "specific_date" and llm_response.specific_date:
-                analysis = st.session_state.analyzer.find_tasks_impacted_by_date(
-                    st.session_state.tasks, llm_response.specific_date
-                )
-                return format_task_impact_response(llm_response, analysis)
+        # Process query using LLM, unless the response was already streamed
+        if llm_response is None:
+            llm_response = get_query_processor().process_query(query, st.session_state.tasks)
         
-        elif llm_response.response_type == "schedule_impact":
-            if llm_response.analysis_type == "weekend_impact":
-                analysis = st.session_state.analyzer.calculate_weekend_impact(st.session_state.tasks)
-                return format_schedule_impact_response(llm_response, analysis)
-        
-        # For general queries or fallbacks
-        return {
-            "text": llm_response.answer if hasattr(llm_response, 'answer') else llm_response.query_understanding,
-            "follow_up": llm_response.follow_up_questions,
-            "data": None,
-            "chart": None
-        }
+        # Dispatch on the response type, each handler runs the matching analysis
+        handler = RESPONSE_HANDLERS[llm_response.response_type]
+        return handler(llm_response, st.session_state.tasks, st.session_state.tasks_sig)
         
     except Exception as e:
-        logger.error(f"Error processing query: {str(e)}")
-        return {"text": f"Error processing your query: {str(e)}", "follow_up": [], "data": None, "chart": None}
+        return error_response(e)
+
+# Plain text response, for general queries or fallbacks
+def text_response(text, llm_response):
+    return {
+        "text": text,
+        "follow_up": llm_response.follow_up_questions,
+        "data": None,
+        "chart_json": None
+    }
+
+def handle_task_analysis(llm_response, tasks, tasks_sig):
+    if llm_response.analysis_type == "holiday_impact":
+        return format_task_impact_response(llm_response, holiday_tasks(tasks_sig, tasks))
+    elif llm_response.analysis_type == "specific_date" and llm_response.specific_date:
+        analysis = get_analyzer().find_tasks_impacted_by_date(tasks, llm_response.specific_date)
+        return format_task_impact_response(llm_response, analysis)
+    return text_response(llm_response.query_understanding, llm_response)
+
+def handle_schedule_impact(llm_response, tasks, tasks_sig):
+    if llm_response.analysis_type == "weekend_impact":
+        return format_schedule_impact_response(llm_response, weekend_impact(tasks_sig, tasks))
+    return text_response(llm_response.query_understanding, llm_response)
+
+def handle_general_query(llm_response, tasks, tasks_sig):
+    return text_response(llm_response.answer, llm_response)
+
+RESPONSE_HANDLERS = {
+    "task_analysis": handle_task_analysis,
+    "schedule_impact": handle_schedule_impact,
+    "general_query": handle_general_query
+}
+
+# Build the impacts table column by column rather than from one dict per row
+def impacts_dataframe(impacts):
+    ids, names, starts, ends, impact_types, descriptions, delays = [], [], [], [], [], [], []
+    for impact in impacts:
+        ids.append(impact.task.id)
+        names.append(impact.task.name)
+        starts.append(impact.task.start_date)
+        ends.append(impact.task.end_date)
+        impact_types.append(impact.impact_type)
+        descriptions.append(impact.impact_description)
+        delays.append(impact.delay_days or 0)
+    
+    return pd.DataFrame({
+        "Task ID": ids,
+        "Task Name": names,
+        "Start Date": pd.to_datetime(starts),
+        "End Date": pd.to_datetime(ends),
+        "Impact Type": impact_types,
+        "Impact Description": descriptions,
+        "Delay (Days)": delays
+    })
 
 # Format task impact response
 def format_task_impact_response(llm_response, analysis):
     # Create a DataFrame for visualization
     if analysis and len(analysis) > 0:
-        data = [{
-            "Task ID": impact.task.id,
-            "Task Name": impact.task.name,
-            "Start Date": impact.task.start_date,
-            "End Date": impact.task.end_date,
-            "Impact Type": impact.impact_type,
-            "Impact Description": impact.impact_description,
-            "Delay (Days)": impact.delay_days or 0
-        } for impact in analysis]
+        df = impacts_dataframe(analysis)
         
-        df = pd.DataFrame(data)
+        import plotly.express as px
         
-        # Create a Gantt chart
+        # Create a Gantt chart, capped so large task sets stay cheap to render in the browser
+        chart_df = df.nlargest(MAX_GANTT_ROWS, "Delay (Days)", keep="first") if len(df) > MAX_GANTT_ROWS else df
         fig = px.timeline(
-            df, 
+            chart_df, 
             x_start="Start Date", 
             x_end="End Date", 
             y="Task Name",
@@ -120,38 +211,36 @@ def format_task_impact_response(llm_response, analysis):
             title="Tasks Impacted by Holidays/Weekends",
             xaxis_title="Date",
             yaxis_title="Task",
-            height=600
+            height=600,
+            uirevision="stable"  # Keep zoom/pan across Streamlit reruns
         )
+        if len(chart_df) < len(df):
+            fig.add_annotation(
+                text=f"Showing top {len(chart_df)} of {len(df)} tasks by delay",
+                xref="paper", yref="paper", x=1, y=1.05,
+                showarrow=False
+            )
         
         return {
-            "text": llm_response.impact_summary if hasattr(llm_response, 'impact_summary') else 
-                   f"Found {len(analysis)} impacted tasks.",
+            "text": llm_response.impact_summary,
             "follow_up": llm_response.follow_up_questions,
             "data": df,
-            "chart": fig
+            "chart_json": fig.to_json()
         }
     else:
         return {
             "text": "No tasks found matching your query.",
             "follow_up": llm_response.follow_up_questions,
             "data": None,
-            "chart": None
+            "chart_json": None
         }
 
 # Format schedule impact response
 def format_schedule_impact_response(llm_response, analysis):
     if analysis and len(analysis.impacted_tasks) > 0:
-        data = [{
-            "Task ID": impact.task.id,
-            "Task Name": impact.task.name,
-            "Start Date": impact.task.start_date,
-            "End Date": impact.task.end_date,
-            "Impact Type": impact.impact_type,
-            "Impact Description": impact.impact_description,
-            "Delay (Days)": impact.delay_days or 0
-        } for impact in analysis.impacted_tasks]
+        df = impacts_dataframe(analysis.impacted_tasks)
         
-        df = pd.DataFrame(data)
+        import plotly.express as px
         
         # Create a bar chart showing delay by task
         fig = px.bar(
@@ -161,19 +250,20 @@ def format_schedule_impact_response(llm_response, analysis):
             color="Impact Type",
             title="Top 10 Tasks with Highest Delay"
         )
+        fig.update_layout(uirevision="stable")
         
         return {
-            "text": llm_response.impact_summary if hasattr(llm_response, 'impact_summary') else analysis.analysis_summary,
+            "text": llm_response.impact_summary,
             "follow_up": llm_response.follow_up_questions,
             "data": df,
-            "chart": fig
+            "chart_json": fig.to_json()
         }
     else:
         return {
             "text": "No schedule impact found for your query.",
             "follow_up": llm_response.follow_up_questions,
             "data": None,
-            "chart": None
+            "chart_json": None
         }
 
 # Main app
@@ -200,12 +290,9 @@ def main():
         uploaded_file = st.file_uploader("Upload MS Project Excel file", type=["xlsx"])
         
         if uploaded_file is not None:
-            # Save the uploaded file temporarily
-            with open("temp_project_data.xlsx", "wb") as f:
-                f.write(uploaded_file.getvalue())
-            
             if st.button("Load Data"):
-                success, message = load_data("temp_project_data.xlsx")
+                # Parsed straight from memory, no temporary file is written
+                success, message = load_data(uploaded_file.getvalue())
                 if success:
                     st.success(message)
                 else:
@@ -217,11 +304,11 @@ def main():
             st.write(f"Total tasks: {len(st.session_state.tasks)}")
             
             # Count tasks with weekend/holiday impacts
-            holiday_tasks = len(st.session_state.analyzer.find_holiday_tasks(st.session_state.tasks))
-            weekend_tasks = len(st.session_state.analyzer.find_weekend_tasks(st.session_state.tasks))
+            holiday_count = len(holiday_tasks(st.session_state.tasks_sig, st.session_state.tasks))
+            weekend_count = len(weekend_tasks(st.session_state.tasks_sig, st.session_state.tasks))
             
-            st.write(f"Tasks affected by holidays: {holiday_tasks}")
-            st.write(f"Tasks affected by weekends: {weekend_tasks}")
+            st.write(f"Tasks affected by holidays: {holiday_count}")
+            st.write(f"Tasks affected by weekends: {weekend_count}")
     
     # Main content area
     if not st.session_state.data_loaded:
@@ -237,19 +324,36 @@ def main():
             # Add user query to chat history
             st.session_state.chat_history.append({"role": "user", "content": query})
             
-            # Process query
-            response = process_query(query)
+            # Stream the LLM response, then run the analysis once the response is complete
+            placeholder = st.empty()
+            holder = {}
+            try:
+                with placeholder.container():
+                    with st.chat_message("assistant"):
+                        st.write_stream(stream_llm_text(query, holder))
+                response = process_query(query, holder.get("response"))
+            except Exception as e:
+                response = error_response(e)
+            placeholder.empty()
             
             # Add assistant response to chat history
-            st.session_state.chat_history.append({"role": "assistant", "content": response})
+            st.session_state.chat_history.append(assistant_message(response))
         
         # Display chat history
         st.subheader("Conversation")
-        for idx, message in enumerate(st.session_state.chat_history):
-            if message["role"] == "user":
-                st.markdown(f"**You:** {message['content']}")
-            else:
-                st.markdown(f"**Assistant:** {message['content']['text']}")
+        key_counts = {}
+        for message in st.session_state.chat_history:
+            with st.chat_message(message["role"]):
+                if message["role"] == "user":
+                    st.markdown(message['content'])
+                    continue
+                
+                # Repeated answers share a content key, later copies get a counter suffix
+                count = key_counts.get(message['mkey'], 0)
+                key_counts[message['mkey']] = count + 1
+                mkey = message['mkey'] if count == 0 else f"{message['mkey']}_{count}"
+                
+                st.markdown(message['content']['text'])
                 
                 # Display data table if available
                 if message['content']['data'] is not None:
@@ -257,14 +361,14 @@ def main():
                         st.dataframe(message['content']['data'])
                 
                 # Display chart if available
-                if message['content']['chart'] is not None:
-                    st.plotly_chart(message['content']['chart'], use_container_width=True, key=f"chart_{idx}")
+                if message['content']['chart_json'] is not None:
+                    st.plotly_chart(chart_from_json(message['content']['chart_json']), use_container_width=True, key=f"chart_{mkey}")
                 
                 # Display follow-up suggestions
                 if message['content']['follow_up'] and len(message['content']['follow_up']) > 0:
                     st.subheader("Follow-up Questions")
                     for i, question in enumerate(message['content']['follow_up']):
-                        if st.button(question, key=f"follow_up_{idx}_{i}"):
+                        if st.button(question, key=f"follow_up_{mkey}_{i}"):
                             # Add follow-up to chat history
                             st.session_state.chat_history.append({"role": "user", "content": question})
                             
@@ -272,7 +376,7 @@ def main():
                             follow_up_response = process_query(question)
                             
                             # Add assistant response
-                            st.session_state.chat_history.append({"role": "assistant", "content": follow_up_response})
+                            st.session_state.chat_history.append(assistant_message(follow_up_response))
                             
                             # Rerun to update UI
                             st.rerun()
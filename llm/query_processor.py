@@ -1,8 +1,10 @@
 import instructor
 import logging
-from typing import Optional, Dict, Any, Union, List
+from typing import Optional, Dict, Any, Iterator, Tuple, Union, List
 from datetime import datetime
+from functools import lru_cache
 import re
+import holidays
 from dateutil import parser as date_parser
 from pydantic import BaseModel
 import sys
@@ -12,110 +14,362 @@ from openai import OpenAI
 # Add the project root to the path to enable absolute imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from backend.config import settings
+from backend.analyzer import analyzer
+from backend.models import Task
 from .schemas import TaskAnalysisResponse, ScheduleImpactResponse, GeneralQueryResponse
+from .response_cache import ResponseCache
 
 logger = logging.getLogger(__name__)
 
-# Initialize OpenRouter client with Instructor for Gemini model
-client = instructor.from_openai(OpenAI(
-    api_key=settings.OPENROUTER_API_KEY,
-    base_url="https://openrouter.ai/api/v1"),
-    mode=instructor.Mode.JSON,
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None  # Keywords are matched with the compiled _CLASSIFIER pattern instead
+
+SYSTEM_PROMPT = "You are a project management assistant that analyzes MS Project data."
+
+@lru_cache(maxsize=1)
+def get_client() -> instructor.Instructor:
+    """Get the OpenRouter client with Instructor for Gemini model, created on first use
     
+    Returns:
+        instructor.Instructor: Shared client
+    """
+    return instructor.from_openai(OpenAI(
+        api_key=settings.OPENROUTER_API_KEY,
+        base_url="https://openrouter.ai/api/v1"),
+        mode=instructor.Mode.JSON,
+    )
+
+# Date patterns or holiday names that mark a query as being about a specific date
+DATE_PATTERNS = (
+    r'\b\d{1,2}/\d{1,2}(/\d{2,4})?\b',  # MM/DD/YYYY or MM/DD
+    r'\b(january|february|march|april|may|june|july|august|september|october|november|december)\s+\d{1,2}(st|nd|rd|th)?(,\s+\d{4})?\b',
+    r'\bjuly\s+4th\b',  # Special case for July 4th
+    r'\bnew\s+year\b',
+    r'\bchristmas\b',
+    r'\bthanksgiving\b',
+    r'\bmemorial\s+day\b',
+    r'\blabor\s+day\b',
+    r'\bindependence\s+day\b',
+    r'\bveterans\s+day\b',
+    r'\bmlk\s+day\b',
+    r'\bmartin\s+luther\s+king\b'
 )
+# Month and day of holidays that fall on a fixed date
+_HOLIDAY_MAP = {
+    "july 4th": (7, 4),
+    "independence day": (7, 4),
+    "christmas": (12, 25),
+    "new year": (1, 1),
+    "veterans day": (11, 11)
+}
+# Holidays that move every year, looked up by their name in holidays.US()
+_FLOATING_HOLIDAYS = {
+    "thanksgiving": "Thanksgiving",
+    "memorial day": "Memorial Day",
+    "labor day": "Labor Day",
+    "mlk day": "Martin Luther King",
+    "martin luther king": "Martin Luther King"
+}
+# Follow-up questions offered with responses built without the LLM
+_TEMPLATE_FOLLOW_UPS = {
+    "holiday_impact": (
+        "Which tasks are impacted by July 4th?",
+        "How many days would we prolong project delivery if no task can be completed during weekends?"
+    ),
+    "weekend_impact": (
+        "Which tasks start on a holiday?",
+        "Which tasks are impacted by Christmas?"
+    )
+}
+HOLIDAY_KEYWORDS = ("holiday", "federal holiday", "national holiday")
+WEEKEND_KEYWORDS = ("weekend", "saturday", "sunday")
+
+# Compiled once so each check is a single scan over the query.
+# Keywords are matched as substrings, like the plain `in` checks they replace ("holidays" still matches).
+_DATE_RE = re.compile("|".join(f"(?:{pattern})" for pattern in DATE_PATTERNS), re.IGNORECASE)
+_EXPLICIT_DATE_RE = re.compile("|".join(f"(?:{pattern})" for pattern in DATE_PATTERNS[:2]), re.IGNORECASE)
+_HOLIDAY_NAME_RE = re.compile(
+    r"\b(?:" + "|".join(name.replace(" ", r"\s+") for name in (*_HOLIDAY_MAP, *_FLOATING_HOLIDAYS)) + r")\b",
+    re.IGNORECASE
+)
+# Years mentioned alongside a holiday name, e.g. "Christmas 2021"
+_YEAR_RE = re.compile(r"\b(?:19|20)\d{2}\b")
+# Holiday keywords, weekend keywords and date patterns as named groups of one pattern
+_CLASSIFIER = re.compile(
+    "(?P<holiday>" + "|".join(re.escape(keyword) for keyword in HOLIDAY_KEYWORDS) + ")"
+    "|(?P<weekend>" + "|".join(re.escape(keyword) for keyword in WEEKEND_KEYWORDS) + ")"
+    "|(?P<date>" + "|".join(f"(?:{pattern})" for pattern in DATE_PATTERNS) + ")",
+    re.IGNORECASE
+)
+
+def _build_keyword_automaton():
+    """Build an Aho-Corasick automaton over the holiday and weekend keywords, each hit yields its category"""
+    automaton = ahocorasick.Automaton()
+    for category, keywords in (("holiday", HOLIDAY_KEYWORDS), ("weekend", WEEKEND_KEYWORDS)):
+        for keyword in keywords:
+            automaton.add_word(keyword, category)
+    automaton.make_automaton()
+    return automaton
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton() if ahocorasick is not None else None
 
 class QueryProcessor:
     """Class for processing natural language queries using LLM"""
     
     def __init__(self):
         """Initialize the query processor"""
-        self.client = client
+        self.client = get_client()
+        self._cache = ResponseCache(
+            directory=settings.LLM_CACHE_DIR,
+            size_limit=settings.LLM_CACHE_SIZE_LIMIT,
+            expire=settings.LLM_CACHE_EXPIRE
+        )
+    
+    def _cached_llm_call(self, query: str, analysis_type: str, specific_date: Optional[datetime],
+                         response_model: type, prompt: str) -> Optional[BaseModel]:
+        """Get a structured LLM response, reusing a cached one for the same query
+        
+        Args:
+            query: Original query
+            analysis_type: Type of analysis
+            specific_date: Specific date if applicable
+            response_model: Pydantic model the response is parsed into
+            prompt: Prompt to send on a cache miss
+            
+        Returns:
+            Optional[BaseModel]: Structured response
+        """
+        cached = self._cache.get(analysis_type, query, specific_date, response_model)
+        if cached is not None:
+            return cached
+        
+        response = self.client.chat.completions.create(
+            model=settings.MODEL_NAME,
+            response_model=response_model,
+            messages=[
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            temperature=settings.TEMPERATURE,
+            max_tokens=settings.MAX_TOKENS
+        )
+        
+        # Only successful responses are cached, fallbacks are rebuilt on every error
+        if response is not None:
+            self._cache.set(analysis_type, query, specific_date, response)
+        return response
     
-    def process_query(self, query: str) -> Union[TaskAnalysisResponse, ScheduleImpactResponse, GeneralQueryResponse]:
+    def process_query(self, query: str, tasks: Optional[List[Task]] = None) -> Union[TaskAnalysisResponse, ScheduleImpactResponse, GeneralQueryResponse]:
         """Process a natural language query and return structured response
         
         Args:
             query: User's natural language query
+            tasks: Loaded tasks, lets holiday and weekend queries be answered without the LLM
             
         Returns:
             Union[TaskAnalysisResponse, ScheduleImpactResponse, GeneralQueryResponse]: Structured response
         """
-        # Pre-process query to extract dates and other entities
-        preprocessed_query = self._preprocess_query(query)
+        analysis_type, specific_date = self._classify(query)
         
-        # Determine query type based on content
-        if self._is_holiday_query(preprocessed_query):
-            return self._get_task_analysis_response(query, "holiday_impact")
-        elif self._is_weekend_query(preprocessed_query):
-            return self._get_schedule_impact_response(query, "weekend_impact")
-        elif self._is_specific_date_query(preprocessed_query):
-            date = self._extract_date(query)
-            return self._get_task_analysis_response(query, "specific_date", date)
-        else:
+        structural_response = self._structural_response(analysis_type, tasks)
+        if structural_response is not None:
+            return structural_response
+        
+        if analysis_type == "weekend_impact":
+            return self._get_schedule_impact_response(query, analysis_type)
+        elif analysis_type == "general_query":
             return self._get_general_query_response(query)
+        else:
+            return self._get_task_analysis_response(query, analysis_type, specific_date)
     
-    def _preprocess_query(self, query: str) -> str:
-        """Preprocess the query for better entity extraction
+    def stream_query(self, query: str, tasks: Optional[List[Task]] = None) -> Iterator[BaseModel]:
+        """Process a query, yielding partial responses while the LLM streams them
+        
+        Partial responses have every field optional. The last response yielded is always
+        the complete structured response, or the usual fallback when the LLM call fails.
+        
+        Args:
+            query: User's natural language query
+            tasks: Loaded tasks, lets holiday and weekend queries be answered without the LLM
+            
+        Returns:
+            Iterator[BaseModel]: Partial responses followed by the complete response
+        """
+        analysis_type, specific_date = self._classify(query)
+        
+        structural_response = self._structural_response(analysis_type, tasks)
+        if structural_response is not None:
+            yield structural_response
+            return
+        
+        response_model, prompt = self._request_for(query, analysis_type, specific_date)
+        
+        cached = self._cache.get(analysis_type, query, specific_date, response_model)
+        if cached is not None:
+            yield cached
+            return
+        
+        try:
+            partial = None
+            for partial in self.client.chat.completions.create_partial(
+                model=settings.MODEL_NAME,
+                response_model=response_model,
+                messages=[
+                    {"role": "system", "content": SYSTEM_PROMPT},
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=settings.TEMPERATURE,
+                max_tokens=settings.MAX_TOKENS
+            ):
+                yield partial
+            
+            if partial is None:
+                raise ValueError("No response from LLM")
+            response = response_model.model_validate(partial.model_dump(exclude_none=True))
+            self._cache.set(analysis_type, query, specific_date, response)
+            yield response
+        except Exception as e:
+            logger.error(f"Error streaming LLM response: {str(e)}")
+            yield self._fallback_response(analysis_type, specific_date, e)
+    
+    def _structural_response(self, analysis_type: str, tasks: Optional[List[Task]]) -> Optional[BaseModel]:
+        """Answer a holiday or weekend query straight from the analyzer, without calling the LLM
+        
+        Args:
+            analysis_type: Type of analysis
+            tasks: Loaded tasks, if any
+            
+        Returns:
+            Optional[BaseModel]: Templated response, or None when the LLM should answer
+        """
+        if settings.USE_LLM_FOR_STRUCTURAL_RESPONSES or tasks is None:
+            return None
+        
+        if analysis_type == "holiday_impact":
+            analysis = analyzer.analyze_query(analysis_type, tasks)
+            return TaskAnalysisResponse(
+                response_type="task_analysis",
+                query_understanding="Find tasks that start or end on a US federal holiday",
+                analysis_type=analysis_type,
+                impacted_tasks_count=len(analysis.impacted_tasks),
+                impact_summary=f"Found {len(analysis.impacted_tasks)} tasks starting or ending on a US federal holiday.",
+                follow_up_questions=list(_TEMPLATE_FOLLOW_UPS[analysis_type])
+            )
+        elif analysis_type == "weekend_impact":
+            analysis = analyzer.analyze_query(analysis_type, tasks)
+            return ScheduleImpactResponse(
+                response_type="schedule_impact",
+                query_understanding="Estimate the project delay if no task can be worked on during weekends",
+                analysis_type=analysis_type,
+                total_delay_days=analysis.total_project_delay or 0,
+                impact_summary=analysis.analysis_summary,
+                follow_up_questions=list(_TEMPLATE_FOLLOW_UPS[analysis_type])
+            )
+        return None
+    
+    def _classify(self, query: str) -> Tuple[str, Optional[datetime]]:
+        """Determine the analysis a query asks for
         
         Args:
             query: Original query
             
         Returns:
-            str: Preprocessed query
+            Tuple[str, Optional[datetime]]: Analysis type and the date mentioned, if any
         """
-        # Convert to lowercase for easier matching
-        return query.lower()
+        # Pre-process query to extract dates and other entities
+        preprocessed_query = self._preprocess_query(query)
+        
+        # Determine query type based on content in a single scan. Holiday keywords win over
+        # weekend keywords, which win over dates, wherever they appear in the query.
+        if _KEYWORD_AUTOMATON is not None:
+            # The automaton is case-sensitive and holds lowercase keywords
+            kinds = {category for _, category in _KEYWORD_AUTOMATON.iter(preprocessed_query.lower())}
+            if not kinds and _DATE_RE.search(preprocessed_query):
+                kinds.add("date")
+        else:
+            kinds = set()
+            for match in _CLASSIFIER.finditer(preprocessed_query):
+                kinds.add(match.lastgroup)
+                if match.lastgroup == "holiday":
+                    break
+        
+        if "holiday" in kinds:
+            return "holiday_impact", None
+        elif "weekend" in kinds:
+            return "weekend_impact", None
+        elif "date" in kinds:
+            return "specific_date", self._extract_date(query)
+        else:
+            return "general_query", None
     
-    def _is_holiday_query(self, query: str) -> bool:
-        """Check if query is about holiday impact
+    def _request_for(self, query: str, analysis_type: str, specific_date: Optional[datetime]) -> Tuple[type, str]:
+        """Get the response model and prompt for an analysis type
         
         Args:
-            query: Preprocessed query
+            query: Original query
+            analysis_type: Type of analysis
+            specific_date: Specific date if applicable
             
         Returns:
-            bool: True if query is about holidays
+            Tuple[type, str]: Response model and formatted prompt
         """
-        holiday_keywords = ["holiday", "federal holiday", "national holiday"]
-        return any(keyword in query for keyword in holiday_keywords)
+        if analysis_type == "weekend_impact":
+            return ScheduleImpactResponse, self._create_schedule_impact_prompt(query, analysis_type)
+        elif analysis_type == "general_query":
+            return GeneralQueryResponse, self._create_general_query_prompt(query)
+        else:
+            return TaskAnalysisResponse, self._create_task_analysis_prompt(query, analysis_type, specific_date)
     
-    def _is_weekend_query(self, query: str) -> bool:
-        """Check if query is about weekend impact
+    def _fallback_response(self, analysis_type: str, specific_date: Optional[datetime], error: Exception) -> BaseModel:
+        """Build the response returned when the LLM call fails
         
         Args:
-            query: Preprocessed query
+            analysis_type: Type of analysis
+            specific_date: Specific date if applicable
+            error: Error raised by the LLM call, None when it returned nothing
             
         Returns:
-            bool: True if query is about weekends
+            BaseModel: Fallback response for the analysis type
         """
-        weekend_keywords = ["weekend", "saturday", "sunday"]
-        return any(keyword in query for keyword in weekend_keywords)
+        if analysis_type == "weekend_impact":
+            return ScheduleImpactResponse(
+                response_type="schedule_impact",
+                query_understanding="Error processing query",
+                analysis_type=analysis_type,
+                total_delay_days=0,
+                impact_summary=f"Error: {str(error)}"
+            )
+        elif analysis_type == "general_query":
+            return GeneralQueryResponse(
+                response_type="general_query",
+                query_understanding="Error processing query",
+                analysis_type="general_query",
+                answer=f"Error: {str(error)}",
+                confidence=0.0
+            )
+        else:
+            return TaskAnalysisResponse(
+                response_type="task_analysis",
+                query_understanding="Error processing query",
+                analysis_type=analysis_type,
+                specific_date=specific_date,
+                impacted_tasks_count=0,
+                impact_summary="No response from LLM"
+            )
     
-    def _is_specific_date_query(self, query: str) -> bool:
-        """Check if query is about a specific date
+    def _preprocess_query(self, query: str) -> str:
+        """Preprocess the query for better entity extraction
         
         Args:
-            query: Preprocessed query
+            query: Original query
             
         Returns:
-            bool: True if query mentions a specific date
+            str: Preprocessed query
         """
-        # Check for date patterns or holiday names
-        date_patterns = [
-            r'\b\d{1,2}/\d{1,2}(/\d{2,4})?\b',  # MM/DD/YYYY or MM/DD
-            r'\b(january|february|march|april|may|june|july|august|september|october|november|december)\s+\d{1,2}(st|nd|rd|th)?(,\s+\d{4})?\b',
-            r'\bjuly\s+4th\b',  # Special case for July 4th
-            r'\bnew\s+year\b',
-            r'\bchristmas\b',
-            r'\bthanksgiving\b',
-            r'\bmemorial\s+day\b',
-            r'\blabor\s+day\b',
-            r'\bindependence\s+day\b',
-            r'\bveterans\s+day\b',
-            r'\bmlk\s+day\b',
-            r'\bmartin\s+luther\s+king\b'
-        ]
-        
-        return any(re.search(pattern, query, re.IGNORECASE) for pattern in date_patterns)
+        # Every pattern matches case-insensitively, so no lowercased copy is needed
+        return query
     
     def _extract_date(self, query: str) -> Optional[datetime]:
         """Extract date from query
@@ -127,20 +381,24 @@ class QueryProcessor:
             Optional[datetime]: Extracted date if found
         """
         try:
-            # Handle special cases first
-            if re.search(r'\bjuly\s+4th\b', query, re.IGNORECASE):
-                # Get current year
-                current_year = datetime.now().year
-                return datetime(current_year, 7, 4)
+            # Holiday names map straight to a date, in the year closest to the name or the current year
+            match = _HOLIDAY_NAME_RE.search(query)
+            if match:
+                name = " ".join(match.group(0).lower().split())
+                # Characters between each year and the holiday name, whichever side the year is on
+                years = [(max(year.start() - match.end(), match.start() - year.end()), int(year.group(0)))
+                         for year in _YEAR_RE.finditer(query)]
+                year = min(years)[1] if years else datetime.now().year
+                if name in _HOLIDAY_MAP:
+                    return datetime(year, *_HOLIDAY_MAP[name])
+                observed = holidays.US(years=year).get_named(_FLOATING_HOLIDAYS[name])
+                if observed:
+                    return datetime.combine(observed[0], datetime.min.time())
             
-            # Try to extract date using dateutil parser
-            # This is a simplified approach and might need refinement
-            for word in query.split():
-                try:
-                    date = date_parser.parse(word, fuzzy=True)
-                    return date
-                except:
-                    continue
+            # Parse only the span that looks like a date
+            match = _EXPLICIT_DATE_RE.search(query)
+            if match:
+                return date_parser.parse(match.group(0), fuzzy=False)
             
             return None
         except Exception as e:
@@ -152,32 +410,13 @@ class QueryProcessor:
         prompt = self._create_task_analysis_prompt(query, analysis_type, specific_date)
         
         try:
-            # Add default values for the response
-            default_response = TaskAnalysisResponse(
-                response_type="task_analysis",
-                query_understanding="Error processing query",
-                analysis_type=analysis_type,
-                specific_date=specific_date,
-                impacted_tasks_count=0,
-                impact_summary="No response from LLM"
-            )
-    
-            response = self.client.chat.completions.create(
-                messages=[
-                    {"role": "system", "content": "You are a project management assistant that analyzes MS Project data."},
-                    {"role": "user", "content": prompt}
-                ],
-                model=settings.MODEL_NAME,
-                response_model=TaskAnalysisResponse,
-                temperature=settings.TEMPERATURE,
-                max_tokens=settings.MAX_TOKENS
-            )
+            response = self._cached_llm_call(query, analysis_type, specific_date, TaskAnalysisResponse, prompt)
             
-            return response if response is not None else default_response
+            return response if response is not None else self._fallback_response(analysis_type, specific_date, None)
             
         except Exception as e:
             logger.error(f"Error getting LLM response: {str(e)}")
-            return default_response
+            return self._fallback_response(analysis_type, specific_date, e)
     
     # Similarly update _get_schedule_impact_response and _get_general_query_response with the same pattern
     def _get_schedule_impact_response(self, query: str, analysis_type: str) -> ScheduleImpactResponse:
@@ -193,27 +432,12 @@ class QueryProcessor:
         prompt = self._create_schedule_impact_prompt(query, analysis_type)
         
         try:
-            response = self.client.chat.completions.create(
-                model=settings.MODEL_NAME,
-                response_model=ScheduleImpactResponse,
-                messages=[
-                    {"role": "system", "content": "You are a project management assistant that analyzes MS Project data."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=settings.TEMPERATURE,
-                max_tokens=settings.MAX_TOKENS
-            )
+            response = self._cached_llm_call(query, analysis_type, None, ScheduleImpactResponse, prompt)
             return response
         except Exception as e:
             logger.error(f"Error getting LLM response: {str(e)}")
             # Return a fallback response
-            return ScheduleImpactResponse(
-                response_type="schedule_impact",
-                query_understanding="Error processing query",
-                analysis_type=analysis_type,
-                total_delay_days=0,
-                impact_summary=f"Error: {str(e)}"
-            )
+            return self._fallback_response(analysis_type, None, e)
     
     def _get_general_query_response(self, query: str) -> GeneralQueryResponse:
         """Get structured general query response from LLM
@@ -227,27 +451,12 @@ class QueryProcessor:
         prompt = self._create_general_query_prompt(query)
         
         try:
-            response = self.client.chat.completions.create(
-                model=settings.MODEL_NAME,
-                response_model=GeneralQueryResponse,
-                messages=[
-                    {"role": "system", "content": "You are a project management assistant that analyzes MS Project data."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=settings.TEMPERATURE,
-                max_tokens=settings.MAX_TOKENS
-            )
+            response = self._cached_llm_call(query, "general_query", None, GeneralQueryResponse, prompt)
             return response
         except Exception as e:
             logger.error(f"Error getting LLM response: {str(e)}")
             # Return a fallback response
-            return GeneralQueryResponse(
-                response_type="general_query",
-                query_understanding="Error processing query",
-                analysis_type="general_query",
-                answer=f"Error: {str(e)}",
-                confidence=0.0
-            )
+            return self._fallback_response("general_query", None, e)
     
     def _create_task_analysis_prompt(self, query: str, analysis_type: str, specific_date: Optional[datetime] = None) -> str:
         """Create prompt for task analysis
@@ -0,0 +1,165 @@
+import hashlib
+import logging
+import re
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Optional, Tuple, Type, TypeVar
+
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+try:
+    import diskcache
+except ImportError:
+    diskcache = None  # Responses are only cached in memory
+
+ResponseT = TypeVar("ResponseT", bound=BaseModel)
+
+class ResponseCache:
+    """Exact-match cache for structured LLM responses
+    
+    Responses are keyed by analysis type, date and normalized query text, so only
+    queries that differ by case, punctuation or spacing share an entry. When a
+    directory is given and diskcache is installed, responses are also persisted
+    there and reloaded on startup.
+    """
+    
+    def __init__(self, max_entries: int = 1024, directory: Optional[str] = None,
+                 size_limit: int = 256 << 20, expire: Optional[float] = 86400):
+        """Initialize the cache, reloading persisted responses if any
+        
+        Args:
+            max_entries: Maximum number of responses kept in memory, oldest are evicted first
+            directory: Directory to persist responses in, None to keep them in memory only
+            size_limit: Maximum size of the persisted cache in bytes
+            expire: Seconds after which a response expires, None to keep it forever
+        """
+        self.max_entries = max_entries
+        self.expire = expire
+        self._lock = threading.Lock()
+        # Cache key -> (expiry timestamp or None, serialized response)
+        self._responses: Dict[str, Tuple[Optional[float], str]] = {}
+        
+        self._disk = None
+        if directory and diskcache is not None:
+            try:
+                self._disk = diskcache.Cache(directory, size_limit=size_limit)
+                self._load()
+            except Exception as e:
+                logger.error(f"Error opening response cache at {directory}: {str(e)}")
+                self._disk = None
+    
+    def _load(self):
+        """Reload persisted responses into memory, up to max_entries of them"""
+        for key in self._disk.iterkeys():
+            response_json, expires_at = self._disk.get(key, expire_time=True)  # None once expired
+            # Skip anything in the directory that is not a serialized response
+            if isinstance(response_json, str):
+                self._remember(key, response_json, expires_at)
+            if len(self._responses) >= self.max_entries:
+                break
+        logger.info(f"Loaded {len(self._responses)} cached LLM responses")
+    
+    def _remember(self, key: str, response_json: str, expires_at: Optional[float]):
+        """Add a response to the in-memory tier, the caller holds the lock
+        
+        Args:
+            key: Cache key
+            response_json: Serialized response
+            expires_at: Timestamp after which the response is stale, None if it never is
+        """
+        self._responses.pop(key, None)
+        self._responses[key] = (expires_at, response_json)
+        
+        while len(self._responses) > self.max_entries:
+            del self._responses[next(iter(self._responses))]
+    
+    def _normalize(self, query: str) -> str:
+        """Normalize query text so trivial variations share a key
+        
+        Args:
+            query: Original query
+        
+        Returns:
+            str: Lowercased query with punctuation and extra whitespace removed
+        """
+        return " ".join(re.sub(r"[^\w\s/]", " ", query.lower()).split())
+    
+    def make_key(self, analysis_type: str, query: str, specific_date: Optional[datetime] = None) -> str:
+        """Build the cache key for a query
+        
+        Args:
+            analysis_type: Type of analysis
+            query: Original query
+            specific_date: Specific date mentioned in the query, if any
+        
+        Returns:
+            str: SHA-1 hex digest identifying the query
+        """
+        date_str = specific_date.strftime("%Y-%m-%d") if specific_date else ""
+        raw = "\x1f".join((analysis_type, date_str, self._normalize(query)))
+        return hashlib.sha1(raw.encode()).hexdigest()
+    
+    def get(self, analysis_type: str, query: str, specific_date: Optional[datetime],
+            response_model: Type[ResponseT]) -> Optional[ResponseT]:
+        """Look up a cached response for a query
+        
+        Args:
+            analysis_type: Type of analysis
+            query: Original query
+            specific_date: Specific date mentioned in the query, if any
+            response_model: Pydantic model to rebuild the response as
+        
+        Returns:
+            Optional[ResponseT]: Cached response, or None on a miss
+        """
+        key = self.make_key(analysis_type, query, specific_date)
+        
+        with self._lock:
+            cached = None
+            entry = self._responses.get(key)
+            if entry is not None:
+                expires_at, cached = entry
+                if expires_at is not None and expires_at <= time.time():
+                    del self._responses[key]
+                    cached = None
+            elif self._disk is not None:
+                # Responses evicted from memory may still be persisted
+                cached, expires_at = self._disk.get(key, expire_time=True)
+                if isinstance(cached, str):
+                    self._remember(key, cached, expires_at)
+                else:
+                    cached = None
+        
+        if cached is None:
+            return None
+        
+        try:
+            return response_model.model_validate_json(cached)
+        except Exception as e:
+            logger.warning(f"Discarding unreadable cached response: {str(e)}")
+            return None
+    
+    def set(self, analysis_type: str, query: str, specific_date: Optional[datetime], response: BaseModel):
+        """Store a response for a query
+        
+        Args:
+            analysis_type: Type of analysis
+            query: Original query
+            specific_date: Specific date mentioned in the query, if any
+            response: Structured LLM response to cache
+        """
+        key = self.make_key(analysis_type, query, specific_date)
+        response_json = response.model_dump_json()
+        expires_at = time.time() + self.expire if self.expire is not None else None
+        
+        with self._lock:
+            self._remember(key, response_json, expires_at)
+        
+        if self._disk is not None:
+            try:
+                self._disk.set(key, response_json, expire=self.expire)
+            except Exception as e:
+                logger.error(f"Error persisting LLM response: {str(e)}")
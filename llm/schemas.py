@@ -1,6 +1,10 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional, Literal, Dict, Any
 from datetime import datetime
+from copy import deepcopy
+
+# JSON schemas already generated, keyed by model class and schema arguments
+_JSON_SCHEMA_CACHE: Dict[Any, Dict[str, Any]] = {}
 
 class DateQuery(BaseModel):
     """Model for date-specific queries"""
@@ -19,6 +23,8 @@ class ScheduleImpactQuery(BaseModel):
 
 class LLMResponse(BaseModel):
     """Model for structured LLM responses"""
+    model_config = ConfigDict(extra='ignore')
+    
     response_type: Literal["task_analysis", "schedule_impact", "general_query"] = Field(
         ..., description="Type of response being provided"
     )
@@ -37,6 +43,20 @@ class LLMResponse(BaseModel):
     follow_up_questions: List[str] = Field(
         default_factory=list, description="Suggested follow-up questions"
     )
+    
+    @classmethod
+    def model_json_schema(cls, *args, **kwargs) -> Dict[str, Any]:
+        """JSON schema of the model, generated once per response class and reused for every LLM request"""
+        # instructor wraps the response model in a new subclass on every request
+        base = getattr(cls, "__wrapped__", cls)
+        if base not in (TaskAnalysisResponse, ScheduleImpactResponse, GeneralQueryResponse):
+            return super().model_json_schema(*args, **kwargs)
+        
+        key = (base, args, tuple(sorted(kwargs.items())))
+        if key not in _JSON_SCHEMA_CACHE:
+            _JSON_SCHEMA_CACHE[key] = super().model_json_schema(*args, **kwargs)
+        # Callers may modify the schema they get back
+        return deepcopy(_JSON_SCHEMA_CACHE[key])
 
 class TaskAnalysisResponse(LLMResponse):
     """Model for task analysis responses"""
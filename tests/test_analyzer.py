@@ -0,0 +1,63 @@
+import os
+import sys
+from datetime import date, datetime
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.analyzer import ProjectAnalyzer
+from backend.models import Task
+
+def make_task(task_id: str, start: str, end: str) -> Task:
+    return Task(
+        id=task_id,
+        name=f"Task {task_id}",
+        start_date=date.fromisoformat(start),
+        end_date=date.fromisoformat(end),
+        duration=1
+    )
+
+TASKS = [
+    make_task("1", "2019-07-01", "2019-07-04"),
+    make_task("2", "2019-07-04", "2019-07-10"),
+    make_task("3", "2019-07-05", "2019-07-08"),
+    make_task("4", "2019-06-01", "2019-06-30"),
+    make_task("5", "2019-07-04", "2019-07-04"),
+]
+
+# Start and end dates are both inclusive, results keep the task order
+@pytest.mark.parametrize("target, task_ids", [
+    ("2019-07-04", ["1", "2", "5"]),   # First day of 2 and 5, last day of 1
+    ("2019-07-05", ["2", "3"]),        # Day after 1 ends
+    ("2019-07-08", ["2", "3"]),        # Last day of 3
+    ("2019-07-09", ["2"]),             # Day after 3 ends
+    ("2019-06-30", ["4"]),             # Last day of 4, day before 1 starts
+    ("2019-07-11", []),                # After every task
+    ("2019-05-01", []),                # Before every task
+])
+def test_find_tasks_impacted_by_date_boundaries(target, task_ids):
+    analyzer = ProjectAnalyzer()
+    
+    impacts = analyzer.find_tasks_impacted_by_date(TASKS, datetime.fromisoformat(target))
+    assert [impact.task.id for impact in impacts] == task_ids
+
+@pytest.mark.parametrize("target, impact_type, description, delay_days", [
+    ("2019-07-04", "holiday", "Task is active on 2019-07-04 which is a holiday: Independence Day", 1),
+    ("2019-07-06", "weekend", "Task is active on 2019-07-06 which is a weekend", 1),
+    ("2019-07-09", "general_query", "Task is active on 2019-07-09", 0),
+])
+def test_find_tasks_impacted_by_date_impact(target, impact_type, description, delay_days):
+    analyzer = ProjectAnalyzer()
+    
+    impact = analyzer.find_tasks_impacted_by_date(TASKS, datetime.fromisoformat(target))[0]
+    assert (impact.impact_type, impact.impact_description, impact.delay_days) == (impact_type, description, delay_days)
+
+def test_find_tasks_impacted_by_date_after_the_task_list_changes():
+    analyzer = ProjectAnalyzer()
+    tasks = list(TASKS)
+    analyzer.find_tasks_impacted_by_date(tasks, datetime(2019, 7, 9))
+    tasks.append(make_task("6", "2019-07-09", "2019-07-12"))
+    
+    impacts = analyzer.find_tasks_impacted_by_date(tasks, datetime(2019, 7, 9))
+    assert [impact.task.id for impact in impacts] == ["2", "6"]
@@ -0,0 +1,36 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.data_loader import DataLoader
+
+# Expected days match the original per-row parser, including the values it could not read
+@pytest.mark.parametrize("duration, days", [
+    ("5 days", 5),
+    ("3 DAYS", 3),
+    ("3 days?", 3),
+    ("-2 days", -2),
+    ("6 wks", 30),
+    ("0.5 wks", 2),
+    ("2 weeks", 10),
+    ("16 hours", 2),
+    ("4 hours", 0),
+    ("3.7", 3),
+    ("1e3", 1000),
+    ("5 days 3 hours", 5),
+    ("2wk 3 days", 10),
+    ("16 hrs", 0),
+    ("5d", 0),
+    ("abc", 0),
+    ("", 0),
+    (np.nan, 0),
+])
+def test_process_durations_matches_the_original_parser(duration, days):
+    loader = DataLoader("unused.xlsx")
+    
+    assert loader._process_durations(pd.Series([duration], dtype=object)).tolist() == [days]
@@ -0,0 +1,55 @@
+import os
+import sys
+from datetime import datetime
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.date_utils import DateUtils
+
+# Expected counts match the original day-by-day loop
+@pytest.mark.parametrize("start, end, business_days", [
+    ("2019-07-01", "2019-07-07", 4),    # Independence Day and a weekend
+    ("2019-07-04", "2019-07-04", 0),    # Single holiday
+    ("2019-07-06", "2019-07-06", 0),    # Single weekend day
+    ("2019-07-08", "2019-07-08", 1),    # Single business day
+    ("2019-07-10", "2019-07-08", 0),    # End before start
+    ("2020-11-23", "2020-11-29", 4),    # Thanksgiving week
+    ("2019-12-20", "2020-01-03", 9),    # Christmas and New Year across a year boundary
+    ("2021-12-24", "2022-01-02", 4),    # Observed Christmas and New Year on Fridays
+    ("1999-12-30", "2000-01-04", 3),    # Century boundary
+    ("2019-01-01", "2022-12-31", 1002),
+])
+def test_calculate_business_days(start, end, business_days):
+    date_utils = DateUtils()
+    
+    result = date_utils.calculate_business_days(datetime.fromisoformat(start), datetime.fromisoformat(end))
+    assert result == business_days
+
+def test_business_days_after_a_wider_range_was_counted():
+    date_utils = DateUtils()
+    date_utils.calculate_business_days(datetime(2019, 1, 1), datetime(2022, 12, 31))
+    
+    assert date_utils.calculate_business_days(datetime(2019, 12, 20), datetime(2020, 1, 3)) == 9
+
+@pytest.mark.parametrize("day, next_business_day", [
+    ("2019-07-03", "2019-07-05"),
+    ("2019-08-30", "2019-09-03"),   # Weekend followed by Labor Day
+    ("2019-12-24", "2019-12-26"),
+    ("2020-07-02", "2020-07-06"),   # Observed Independence Day on a Friday
+    ("2021-12-23", "2021-12-27"),
+])
+def test_get_next_business_day(day, next_business_day):
+    date_utils = DateUtils()
+    
+    assert date_utils.get_next_business_day(datetime.fromisoformat(day)) == datetime.fromisoformat(next_business_day)
+
+def test_find_impacted_dates():
+    date_utils = DateUtils()
+    
+    assert date_utils.find_impacted_dates(datetime(2019, 7, 3), datetime(2019, 7, 8)) == [
+        (datetime(2019, 7, 4), "Holiday: Independence Day"),
+        (datetime(2019, 7, 6), "Weekend"),
+        (datetime(2019, 7, 7), "Weekend"),
+    ]
@@ -0,0 +1,60 @@
+import os
+import sys
+from datetime import datetime
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("OPENROUTER_API_KEY", "test")
+
+from llm.query_processor import QueryProcessor
+
+@pytest.fixture
+def processor():
+    # Query parsing needs neither the LLM client nor the response cache
+    return QueryProcessor.__new__(QueryProcessor)
+
+@pytest.mark.parametrize("query, expected", [
+    ("Which tasks are impacted by Christmas 2021?", datetime(2021, 12, 25)),
+    ("What about Thanksgiving 2023?", datetime(2023, 11, 23)),
+    ("Labor Day 2019", datetime(2019, 9, 2)),
+    ("In 2022, which tasks run over July 4th?", datetime(2022, 7, 4)),
+    ("Between 2019 and Christmas 2020", datetime(2020, 12, 25)),     # Nearest year wins
+    ("Christmas 2021 compared to 2019", datetime(2021, 12, 25)),
+    ("What is active on 12/25/2019?", datetime(2019, 12, 25)),
+    ("What is active on March 3, 2020?", datetime(2020, 3, 3)),
+    ("What is the total duration of phase 1?", None),
+])
+def test_extract_date(processor, query, expected):
+    assert processor._extract_date(query) == expected
+
+@pytest.mark.parametrize("query, month, day", [
+    ("Which tasks are impacted by Christmas?", 12, 25),
+    ("Which tasks are impacted by July 4th?", 7, 4),
+])
+def test_extract_date_defaults_to_the_current_year(processor, query, month, day):
+    assert processor._extract_date(query) == datetime(datetime.now().year, month, day)
+
+# Analysis types match the original keyword checks: holiday, then weekend, then date patterns
+@pytest.mark.parametrize("query, analysis_type", [
+    ("Which tasks start on a holiday?", "holiday_impact"),
+    ("Which tasks are impacted by Federal Holidays?", "holiday_impact"),
+    ("Any holiday work on Saturday 07/06/2019?", "holiday_impact"),
+    ("What happens on the weekend?", "weekend_impact"),
+    ("Does anything start on SATURDAY?", "weekend_impact"),
+    ("Weekend work on 07/06/2019?", "weekend_impact"),
+    ("Is anything on Sundays in March 2020?", "weekend_impact"),
+    ("Which tasks are impacted by July 4th?", "specific_date"),
+    ("What is active on 12/25/2019?", "specific_date"),
+    ("Tell me about Christmas 2021", "specific_date"),
+    ("What about Thanksgiving?", "specific_date"),
+    ("What is active on 2019-12-25?", "general_query"),
+    ("What is the total duration of phase 1?", "general_query"),
+    ("Which tasks depend on task 12?", "general_query"),
+])
+def test_classify(processor, query, analysis_type):
+    assert processor._classify(query)[0] == analysis_type
+
+def test_classify_extracts_the_date_only_for_date_queries(processor):
+    assert processor._classify("What is active on 12/25/2019?") == ("specific_date", datetime(2019, 12, 25))
+    assert processor._classify("Any holiday on 12/25/2019?") == ("holiday_impact", None)
@@ -0,0 +1,36 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from llm.response_cache import ResponseCache
+from llm.schemas import GeneralQueryResponse
+
+def make_response(text: str) -> GeneralQueryResponse:
+    return GeneralQueryResponse(
+        query_understanding=text,
+        analysis_type="general_query",
+        answer=text,
+        confidence=1.0,
+    )
+
+def test_trivial_variations_share_an_entry():
+    cache = ResponseCache()
+    cache.set("general", "Which tasks depend on task 12?", None, make_response("task 12"))
+    
+    cached = cache.get("general", "which tasks depend on task 12", None, GeneralQueryResponse)
+    assert cached is not None and cached.answer == "task 12"
+
+def test_queries_differing_only_by_a_number_do_not_collide():
+    cache = ResponseCache()
+    cache.set("general", "What is the total duration of phase 1?", None, make_response("phase 1"))
+    cache.set("general", "Which tasks depend on task 12?", None, make_response("task 12"))
+    
+    assert cache.get("general", "What is the total duration of phase 2?", None, GeneralQueryResponse) is None
+    assert cache.get("general", "Which tasks depend on task 13?", None, GeneralQueryResponse) is None
+
+def test_expired_responses_are_not_served_from_memory():
+    cache = ResponseCache(expire=0)
+    cache.set("general", "Which tasks depend on task 12?", None, make_response("task 12"))
+    
+    assert cache.get("general", "Which tasks depend on task 12?", None, GeneralQueryResponse) is None